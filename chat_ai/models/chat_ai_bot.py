@@ -26,21 +26,25 @@ class ChatAiBot(models.AbstractModel):
 
     def _apply_logic(self, channel, values):
         channel.ensure_one()
+        # Cheap checks on the message and channel first: most messages posted
+        # anywhere in Discuss are rejected here without resolving the bot.
+        # Ignore anything that isn't a plain user message (joins, leaves...),
+        # and only answer in 1:1 chats — never group channels or public
+        # channels, even if someone adds the bot there.
+        if values.get("message_type") != "comment":
+            return
+        if channel.channel_type != "chat":
+            return
+
         bot = self.env.ref("chat_ai.user_chat_ai_bot", raise_if_not_found=False)
         if not bot:
             return
         bot_partner_id = bot.partner_id.id
 
-        # Never react to our own messages (avoids an infinite reply loop) and
-        # ignore anything that isn't a plain user message (joins, leaves...).
+        # Never react to our own messages (avoids an infinite reply loop), and
+        # only in chats where the bot is actually a member.
         if values.get("author_id") == bot_partner_id:
             return
-        if values.get("message_type") != "comment":
-            return
-        # Only 1:1 chats where the bot is actually a member — never group
-        # channels or public channels, even if someone adds the bot there.
-        if channel.channel_type != "chat":
-            return
         if bot_partner_id not in channel.channel_member_ids.partner_id.ids:
             return
 
@@ -82,8 +82,11 @@ class CrmLead(models.Model):
 
     def _get_first_crm_business_stage(self):
         self.ensure_one()
-        stages = self.crm_business_stage_ids or self.env["crm.stage"].search([])
-        return stages.sorted("sequence")[:1]
+        if self.crm_business_stage_ids:
+            return self.crm_business_stage_ids.sorted("sequence")[:1]
+        # crm.stage is already ordered by sequence: let the database pick the
+        # first one instead of loading every stage to sort them in Python.
+        return self.env["crm.stage"].search([], limit=1)
 
     def _append_crm_business_note(self):
         """ Add the business area's note to the opportunity's own comments. """
@@ -117,22 +120,36 @@ class CrmLead(models.Model):
 
     def write(self, vals):
         opportunities = self.filtered(lambda l: l.type == "opportunity")
-        previous_users = {
-            (lead.id, fname): lead[fname]
-            for lead in opportunities
-            for fname in self._CRM_BUSINESS_RESPONSIBLE_FIELDS
-        }
+        # The responsibles only change through their own fields or through the
+        # business line they are computed/related from: any other write (stage
+        # moves, notes, kanban drags...) skips the snapshot and the re-subscribe.
+        responsibles_touched = bool(
+            {"crm_business_id", *self._CRM_BUSINESS_RESPONSIBLE_FIELDS} & vals.keys()
+        )
+        previous_users = {}
+        if responsibles_touched:
+            previous_users = {
+                (lead.id, fname): lead[fname]
+                for lead in opportunities
+                for fname in self._CRM_BUSINESS_RESPONSIBLE_FIELDS
+            }
 
         res = super().write(vals)
 
         # Newly assigned or reassigned preventa/jefe/validador become followers.
-        opportunities._subscribe_crm_business_responsibles(previous_users)
+        if responsibles_touched:
+            opportunities._subscribe_crm_business_responsibles(previous_users)
 
         # Leaving the first stage of the business line re-notifies all three responsibles.
         if "stage_id" in vals:
-            for lead in opportunities:
-                first_stage = lead._get_first_crm_business_stage()
-                if first_stage and lead.stage_id != first_stage:
+            # The first stage only depends on the business line: resolve it
+            # once per line instead of once per opportunity (the fallback is a
+            # search on crm.stage).
+            for leads in opportunities.grouped("crm_business_id").values():
+                first_stage = leads[0]._get_first_crm_business_stage()
+                if not first_stage:
+                    continue
+                for lead in leads.filtered(lambda l: l.stage_id != first_stage):
                     partners = (
                         lead.presale_user_id.partner_id
                         | lead.manager_user_id.partner_id
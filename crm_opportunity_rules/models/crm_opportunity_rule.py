@@ -2,6 +2,8 @@ from ast import literal_eval
 
 from odoo import _, api, fields, models
 from odoo.exceptions import ValidationError
+from odoo.models import PREFETCH_MAX
+from odoo.tools import split_every
 
 
 class CrmOpportunityRule(models.Model):
@@ -47,8 +49,16 @@ class CrmOpportunityRule(models.Model):
 
     @api.depends("suggestion_ids")
     def _compute_suggestion_count(self):
+        # Counted in SQL: a rule run against the whole client base can have
+        # thousands of suggestions, and len(suggestion_ids) would load every
+        # one of them just to show the smart button.
+        counts = dict(
+            self.env["crm.opportunity.suggestion"]._read_group(
+                [("rule_id", "in", self.ids)], ["rule_id"], ["__count"]
+            )
+        )
         for rule in self:
-            rule.suggestion_count = len(rule.suggestion_ids)
+            rule.suggestion_count = counts.get(rule, 0)
 
     @api.constrains("domain")
     def _check_domain(self):
@@ -66,44 +76,64 @@ class CrmOpportunityRule(models.Model):
         # Never re-propose a solution the client already bought (confirmed
         # sale) or already has marked as a current product/service in their
         # profile, and never generate a second suggestion of the same rule
-        # for the same client.
+        # for the same client -- checked as a subquery on the suggestions
+        # instead of loading every suggestion of the rule into an id list.
         domain = domain + [
             ("crm_solution_ids", "not in", [self.product_template_id.id]),
             ("crm_current_product_ids", "not any", [("product_tmpl_id", "=", self.product_template_id.id)]),
-            ("id", "not in", self.suggestion_ids.partner_id.ids),
+            ("crm_suggestion_ids", "not any", [("rule_id", "=", self.id)]),
         ]
         if partner_domain:
             domain = domain + partner_domain
         return self.env["res.partner"].search(domain)
 
-    def _partner_matches(self, partner):
-        """Whether partner currently satisfies self's condition, regardless
-        of any existing suggestion (unlike _get_matching_partners, which
-        excludes partners that already have one). Used to detect that a
-        'new' suggestion has gone stale after a profile change."""
+    def _filter_matching_partners(self, partners):
+        """Subset of partners that currently satisfy self's condition,
+        regardless of any existing suggestion (unlike _get_matching_partners,
+        which excludes partners that already have one). Used to detect that
+        'new' suggestions have gone stale after a profile change. Resolved
+        in a single query for the whole set, so callers checking many
+        suggestions of the same rule don't pay one query per partner."""
         self.ensure_one()
-        if not self.active:
-            return False
+        if not self.active or not partners:
+            return self.env["res.partner"]
         domain = literal_eval(self.domain or "[]")
         domain = domain + [
-            ("id", "=", partner.id),
+            ("id", "in", partners.ids),
             ("crm_solution_ids", "not in", [self.product_template_id.id]),
             ("crm_current_product_ids", "not any", [("product_tmpl_id", "=", self.product_template_id.id)]),
         ]
-        return bool(self.env["res.partner"].search_count(domain))
+        return self.env["res.partner"].search(domain)
 
     def _generate_suggestions(self, partners=None):
         """Evaluate self against partners (or the whole database if not given)
-        and create the missing crm.opportunity.suggestion records."""
+        and create the missing crm.opportunity.suggestion records. Returns how
+        many were created."""
         Suggestion = self.env["crm.opportunity.suggestion"]
+        created = 0
+        if partners is not None and not partners:
+            # Nothing to evaluate: don't run one empty search per rule.
+            return created
         partner_domain = [("id", "in", partners.ids)] if partners is not None else None
         for rule in self:
-            for partner in rule._get_matching_partners(partner_domain):
-                Suggestion.create({
-                    "partner_id": partner.id,
-                    "rule_id": rule.id,
-                    "product_template_id": rule.product_template_id.id,
-                })
+            # Batched creates per rule: the nightly cron evaluates every rule
+            # against the whole client base, so a new rule can match thousands
+            # of partners at once. Create them PREFETCH_MAX at a time, flushing
+            # and evicting each batch from the cache before the next one, so
+            # only one batch of new suggestions is ever held in memory.
+            partner_ids = rule._get_matching_partners(partner_domain).ids
+            common_vals = {
+                "rule_id": rule.id,
+                "product_template_id": rule.product_template_id.id,
+            }
+            for batch in split_every(PREFETCH_MAX, partner_ids):
+                suggestions = Suggestion.create([
+                    {**common_vals, "partner_id": partner_id} for partner_id in batch
+                ])
+                suggestions.flush_recordset()
+                suggestions.invalidate_recordset()
+                created += len(suggestions)
+        return created
 
     def _reconcile_suggestions(self):
         """Full re-evaluation after a rule's condition/product/active state
@@ -122,9 +152,13 @@ class CrmOpportunityRule(models.Model):
         Suggestion = self.env["crm.opportunity.suggestion"].sudo()
         Lead = self.env["crm.lead"].sudo()
         for rule in self:
-            for suggestion in Suggestion.search([("rule_id", "=", rule.id)]):
-                if rule._partner_matches(suggestion.partner_id):
-                    continue
+            # Match every partner involved in one query per rule (existing
+            # suggestions first, candidate leads next) instead of one per
+            # suggestion/lead.
+            suggestions = Suggestion.search([("rule_id", "=", rule.id)])
+            matching = rule._filter_matching_partners(suggestions.partner_id)
+            stale = suggestions.filtered(lambda s: s.partner_id not in matching)
+            for suggestion in stale:
                 if suggestion.state == "converted" and suggestion.lead_id:
                     suggestion.lead_id.message_post(body=_(
                         "Esta oportunidad se creó en base a la regla "
@@ -132,29 +166,33 @@ class CrmOpportunityRule(models.Model):
                         "ahora no la cumple.",
                         rule=rule.name,
                     ))
-                suggestion.unlink()
+            stale.unlink()
 
-            linked_partner_ids = Suggestion.search([("rule_id", "=", rule.id)]).partner_id.ids
+            # Partners still holding a suggestion of this rule are excluded
+            # with a subquery rather than a (potentially huge) id list.
             candidate_leads = Lead.search([
                 ("type", "=", "opportunity"),
                 ("product_template_id", "=", rule.product_template_id.id),
-                ("partner_id", "not in", linked_partner_ids),
+                ("partner_id.crm_suggestion_ids", "not any", [("rule_id", "=", rule.id)]),
             ])
-            adopted_partner_ids = set()
+            matching = rule._filter_matching_partners(candidate_leads.partner_id)
+            # One adopted suggestion per partner (its first matching lead),
+            # all created together.
+            adopted_vals = {}
             for lead in candidate_leads:
                 partner = lead.partner_id
-                if not partner or partner.id in adopted_partner_ids:
+                if not partner or partner.id in adopted_vals:
                     continue
-                if not rule._partner_matches(partner):
+                if partner not in matching:
                     continue
-                Suggestion.create({
+                adopted_vals[partner.id] = {
                     "partner_id": partner.id,
                     "rule_id": rule.id,
                     "product_template_id": rule.product_template_id.id,
                     "state": "converted",
                     "lead_id": lead.id,
-                })
-                adopted_partner_ids.add(partner.id)
+                }
+            Suggestion.create(list(adopted_vals.values()))
 
             rule._generate_suggestions()
 
@@ -182,9 +220,7 @@ class CrmOpportunityRule(models.Model):
 
     def action_generate_suggestions_now(self):
         Suggestion = self.env["crm.opportunity.suggestion"]
-        before = Suggestion.search_count([("rule_id", "in", self.ids)])
-        self._generate_suggestions()
-        after = Suggestion.search_count([("rule_id", "in", self.ids)])
+        count = self._generate_suggestions()
         pruned = Suggestion.search([
             ("rule_id", "in", self.ids), ("state", "=", "new"),
         ])._prune_stale()
@@ -196,7 +232,7 @@ class CrmOpportunityRule(models.Model):
                 "message": _(
                     "%(count)s sugerencia(s) nueva(s) generada(s). "
                     "%(pruned)s sugerencia(s) obsoleta(s) eliminada(s).",
-                    count=after - before,
+                    count=count,
                     pruned=len(pruned),
                 ),
                 "type": "success",
@@ -38,6 +38,10 @@ class CrmOpportunitySuggestion(models.Model):
         "unique(partner_id, rule_id)",
         "Ya existe una sugerencia de esta regla para este cliente.",
     )
+    # Only the pending suggestions are looked up per partner (smart button
+    # count, stale pruning after a profile change); converted/dismissed ones
+    # are history and stay out of this index.
+    _partner_new_idx = models.Index("(partner_id) WHERE state = 'new'")
 
     def action_convert(self):
         Lead = self.env["crm.lead"]
@@ -60,8 +64,10 @@ class CrmOpportunitySuggestion(models.Model):
                 # crm_business enforces stage_id in crm_business_stage_ids via a
                 # constrain checked at create, so the first allowed stage must
                 # be resolved up front instead of fixed up after create().
-                stages = business.crm_business_stage_ids or Stage.search([])
-                first_stage = stages.sorted("sequence")[:1]
+                if business.crm_business_stage_ids:
+                    first_stage = business.crm_business_stage_ids.sorted("sequence")[:1]
+                else:
+                    first_stage = Stage.search([], limit=1)
                 if first_stage:
                     vals["stage_id"] = first_stage.id
             lead = Lead.create(vals)
@@ -84,10 +90,15 @@ class CrmOpportunitySuggestion(models.Model):
         partner (e.g. the client's profile changed and the condition, or
         one of its exclusions, no longer holds). Converted/dismissed
         suggestions are left untouched — those already had a human decide
-        on them."""
-        stale = self.filtered(
-            lambda s: s.state == "new" and not s.rule_id._partner_matches(s.partner_id)
-        )
+        on them.
+
+        Evaluated once per rule for all of its suggestions (one search per
+        rule instead of one per suggestion): the nightly cron runs this over
+        every 'new' suggestion in the database."""
+        stale = self.browse()
+        for rule, suggestions in self.filtered(lambda s: s.state == "new").grouped("rule_id").items():
+            matching = rule._filter_matching_partners(suggestions.partner_id)
+            stale |= suggestions.filtered(lambda s: s.partner_id not in matching)
         if stale:
             stale.unlink()
         return stale
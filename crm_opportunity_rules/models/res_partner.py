@@ -20,16 +20,32 @@ class ResPartner(models.Model):
 
     @api.depends("sale_order_ids.state", "sale_order_ids.order_line.product_id.product_tmpl_id")
     def _compute_crm_solution_ids(self):
+        # Let the database filter by state in a single search for all partners
+        # instead of loading every order of each partner just to discard the
+        # quotations and cancelled ones in Python.
+        confirmed_lines = self.env["sale.order.line"].search([
+            ("order_partner_id", "in", self.ids),
+            ("state", "=", "sale"),
+        ]).grouped("order_partner_id")
+        empty = self.env["sale.order.line"]
         for partner in self:
-            confirmed_lines = partner.sale_order_ids.filtered(lambda o: o.state == "sale").order_line
-            partner.crm_solution_ids = confirmed_lines.product_id.product_tmpl_id
+            partner.crm_solution_ids = confirmed_lines.get(
+                partner, empty
+            ).product_id.product_tmpl_id
 
     @api.depends("crm_suggestion_ids.state")
     def _compute_crm_new_suggestion_count(self):
-        for partner in self:
-            partner.crm_new_suggestion_count = len(
-                partner.crm_suggestion_ids.filtered(lambda s: s.state == "new")
+        # One grouped count for every partner instead of loading each
+        # partner's suggestions (all states) to filter them in Python.
+        counts = dict(
+            self.env["crm.opportunity.suggestion"]._read_group(
+                [("partner_id", "in", self.ids), ("state", "=", "new")],
+                ["partner_id"],
+                ["__count"],
             )
+        )
+        for partner in self:
+            partner.crm_new_suggestion_count = counts.get(partner, 0)
 
     # Fields that, when saved on the client card, may open up a new rule
     # match: re-evaluate immediately instead of waiting for the nightly cron.
@@ -22,10 +22,13 @@ class ResPartner(models.Model):
 
     def write(self, vals):
         to_track = [f for f in self._CRM_PROFILE_TRACKED_O2M_FIELDS if f in vals]
+        if not to_track:
+            # Routine partner writes (address, phone, ...) skip the tracking.
+            return super().write(vals)
         before = {
             partner.id: {fname: ", ".join(partner[fname].mapped("display_name")) for fname in to_track}
             for partner in self
-        } if to_track else {}
+        }
         res = super().write(vals)
         for partner in self:
             for fname in to_track:
@@ -37,8 +37,7 @@ class StockPicking(models.Model):
 
         for po in purchase_orders_to_update:
             # 1. Get all pickings related to this PO and their unique, non-empty partner_ref values.
-            all_pickings = po.picking_ids
-            picking_partner_refs = set(p.partner_ref for p in all_pickings if p.partner_ref)
+            picking_partner_refs = set(filter(None, po.picking_ids.mapped('partner_ref')))
 
             # 2. Get the current terms from the PO's partner_ref to identify manual entries.
             current_po_ref_terms = set()
@@ -50,8 +49,8 @@ class StockPicking(models.Model):
             manual_terms = current_po_ref_terms - picking_partner_refs
             
             # 4. Build the final list in the correct order: manual terms first, then picking refs.
-            sorted_manual_terms = sorted(list(manual_terms))
-            sorted_picking_refs = sorted(list(picking_partner_refs))
+            sorted_manual_terms = sorted(manual_terms)
+            sorted_picking_refs = sorted(picking_partner_refs)
 
             all_terms_ordered = sorted_manual_terms + sorted_picking_refs
 
@@ -22,19 +22,23 @@ class AiTool(models.Model):
 
     _inherit = 'ai.tool'
 
+    # Tool name -> handler method name. Built once with the class instead of
+    # rebuilding a dict of bound methods on every tool call.
+    _MERCAS_BUILTIN_HANDLERS = {
+        'sales_report': '_builtin_sales_report',
+        'purchase_report': '_builtin_purchase_report',
+        'invoice_report': '_builtin_invoice_report',
+        'stock_report': '_builtin_stock_report',
+        'box_stock_report': '_builtin_box_stock_report',
+        'lot_report': '_builtin_lot_report',
+        'stock_lookup': '_builtin_stock_lookup',
+        'partner_info': '_builtin_partner_info',
+    }
+
     def _execute_builtin(self, parameters):
-        handler = {
-            'sales_report': self._builtin_sales_report,
-            'purchase_report': self._builtin_purchase_report,
-            'invoice_report': self._builtin_invoice_report,
-            'stock_report': self._builtin_stock_report,
-            'box_stock_report': self._builtin_box_stock_report,
-            'lot_report': self._builtin_lot_report,
-            'stock_lookup': self._builtin_stock_lookup,
-            'partner_info': self._builtin_partner_info,
-        }.get(self.name)
+        handler = self._MERCAS_BUILTIN_HANDLERS.get(self.name)
         if handler:
-            return handler(parameters)
+            return getattr(self, handler)(parameters)
         return super()._execute_builtin(parameters)
 
     # ── Shared helpers ──────────────────────────────────────────────────────
@@ -100,20 +104,22 @@ class AiTool(models.Model):
         self, records, domain, date_field, group_by, partner_field, amount_field='amount_total'
     ):
         """Group *records* by partner and/or day, summing *amount_field*."""
+        amount_key = f'{amount_field}:sum'
+        day_key = f'{date_field}:day'
         groupby_fields = []
         if group_by in ('customer', 'customer_day'):
             groupby_fields.append(partner_field)
         if group_by in ('day', 'customer_day'):
-            groupby_fields.append(f'{date_field}:day')
+            groupby_fields.append(day_key)
 
         data = records.formatted_read_group(
-            domain, groupby=groupby_fields, aggregates=[f'{amount_field}:sum', '__count']
+            domain, groupby=groupby_fields, aggregates=[amount_key, '__count']
         )
         rows = []
         grand_amount = 0.0
         count = 0
         for row in data:
-            amount = round(row.get(f'{amount_field}:sum') or 0.0, 2)
+            amount = round(row.get(amount_key) or 0.0, 2)
             n = row.get('__count', 0)
             grand_amount += amount
             count += n
@@ -122,7 +128,7 @@ class AiTool(models.Model):
             if partner:
                 entry['partner'] = partner[1]
                 entry['partner_id'] = partner[0]
-            day = row.get(f'{date_field}:day')
+            day = row.get(day_key)
             if day:
                 entry['day'] = day[1]
             rows.append(entry)
@@ -141,21 +147,24 @@ class AiTool(models.Model):
         are NOT interchangeable). *date_path* is the read_group path to the
         line's document date (e.g. 'order_id.date_order', 'move_id.invoice_date').
         """
+        qty_key = f'{qty_field}:sum'
+        amount_key = f'{amount_field}:sum'
+        day_key = f'{date_path}:day'
         groupby_fields = ['product_id', 'product_uom_id', 'lot_id']
         if group_by == 'product_day':
-            groupby_fields.append(f'{date_path}:day')
+            groupby_fields.append(day_key)
 
         data = self._user_model(model_name).formatted_read_group(
             domain, groupby=groupby_fields,
-            aggregates=[f'{qty_field}:sum', f'{amount_field}:sum', '__count'],
+            aggregates=[qty_key, amount_key, '__count'],
         )
         rows = []
         grand_amount = 0.0
         count = 0
         lot_ids = set()
         for row in data:
-            qty = round(row.get(f'{qty_field}:sum') or 0.0, 2)
-            amount = round(row.get(f'{amount_field}:sum') or 0.0, 2)
+            qty = round(row.get(qty_key) or 0.0, 2)
+            amount = round(row.get(amount_key) or 0.0, 2)
             n = row.get('__count', 0)
             grand_amount += amount
             count += n
@@ -170,7 +179,7 @@ class AiTool(models.Model):
                 entry['product_id'] = row['product_id'][0]
             if row.get('product_uom_id'):
                 entry['uom'] = row['product_uom_id'][1]
-            day = row.get(f'{date_path}:day')
+            day = row.get(day_key)
             if day:
                 entry['day'] = day[1]
             if row.get('lot_id'):
@@ -357,8 +366,13 @@ class AiTool(models.Model):
         ]
         domain += self._partner_domain(parameters.get('partner')) + \
             self._date_domain(parameters, 'invoice_date')
-        moves = self._user_model('account.move').search(
-            domain, order='invoice_date desc, id desc', limit=20
+        # search_fetch: load only the columns the rows below use, not every
+        # stored field of account.move (narration, JSON widgets...).
+        moves = self._user_model('account.move').search_fetch(
+            domain,
+            ['name', 'partner_id', 'invoice_date', 'amount_total',
+             'amount_residual', 'payment_state'],
+            order='invoice_date desc, id desc', limit=20,
         )
         rows = [{
             'id': m.id,
@@ -444,17 +458,26 @@ class AiTool(models.Model):
     def _stock_lots_detail(self, products, limit=15):
         """On-hand lots for *products*: lote, proveedor, caducidad, cantidad
         original comprada (`purchase_kg`) y cantidad actual en stock — más
-        próximos a caducar primero (criterio FEFO)."""
-        quants = self._user_model('stock.quant').search([
-            ('product_id', 'in', products.ids),
-            ('location_id.usage', '=', 'internal'),
-            ('lot_id', '!=', False),
-            ('quantity', '>', 0),
-        ])
-        by_lot = {}
-        for quant in quants:
-            lot = quant.lot_id
-            entry = by_lot.setdefault(lot.id, {
+        próximos a caducar primero (criterio FEFO).
+
+        La cantidad por lote se suma en SQL (read_group sobre stock.quant) en
+        vez de cargar cada quant y acumular en Python, y los datos de los
+        lotes se leen de una vez para todos ellos."""
+        data = self._user_model('stock.quant').formatted_read_group(
+            [
+                ('product_id', 'in', products.ids),
+                ('location_id.usage', '=', 'internal'),
+                ('lot_id', '!=', False),
+                ('quantity', '>', 0),
+            ],
+            groupby=['lot_id'], aggregates=['quantity:sum', 'id:min'],
+        )
+        qty_by_lot = {row['lot_id'][0]: row['quantity:sum'] or 0.0 for row in data}
+        # Lotes con la misma caducidad (o sin ella) salen en el orden de su
+        # primer quant, como cuando se recorrían los quants uno a uno.
+        first_quant = {row['lot_id'][0]: row['id:min'] for row in data}
+        lots = [
+            {
                 'lot': lot.name,
                 'lot_id': lot.id,
                 'product_id': lot.product_id.id,
@@ -464,14 +487,13 @@ class AiTool(models.Model):
                     lot.expiration_date.strftime('%Y-%m-%d') if lot.expiration_date else ''
                 ),
                 'original': lot.purchase_kg,
-                'qty': 0.0,
-            })
-            entry['qty'] += quant.quantity
-        lots = sorted(
-            by_lot.values(), key=lambda entry: entry['expiration'] or '9999-99-99'
-        )
-        for entry in lots:
-            entry['qty'] = round(entry['qty'], 2)
+                'qty': round(qty_by_lot[lot.id], 2),
+            }
+            for lot in self._user_model('stock.lot').browse(list(qty_by_lot))
+        ]
+        lots.sort(key=lambda entry: (
+            entry['expiration'] or '9999-99-99', first_quant[entry['lot_id']]
+        ))
         return lots[:limit]
 
     # ── Cajas en cliente/proveedor ───────────────────────────────────────────
@@ -513,11 +535,11 @@ class AiTool(models.Model):
             'street2': partner.street2 or '',
             'city': partner.city or '',
             'zip': partner.zip or '',
-            'state': partner.state_id.name if partner.state_id else '',
-            'country': partner.country_id.name if partner.country_id else '',
+            'state': partner.state_id.name or '',
+            'country': partner.country_id.name or '',
             'vat': partner.vat or '',
-            'parent_id': partner.parent_id.id if partner.parent_id else None,
-            'parent_name': partner.parent_id.name if partner.parent_id else '',
+            'parent_id': partner.parent_id.id or None,
+            'parent_name': partner.parent_id.name or '',
         }
 
     # ── Existencias puntuales (a fecha de hoy, no un rango de movimientos) ──────
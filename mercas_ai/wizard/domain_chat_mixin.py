@@ -31,6 +31,11 @@ _DOMAIN_TOOL = {
 #: group_by values shared by ventas/compras (facturacion adds its own
 #: 'detail' on top of this same set).
 _AMOUNT_GROUP_BY = {'customer', 'day', 'customer_day', 'total', 'product', 'product_day'}
+_INVOICE_GROUP_BY = _AMOUNT_GROUP_BY | {'detail'}
+_STOCK_GROUP_BY = {'product', 'day', 'product_day', 'total'}
+
+#: Rule between the per-record blocks of a multi-record reply.
+_BLOCK_SEPARATOR = '\n' + '-' * 30 + '\n'
 
 _CLASSIFY_PROMPT = (
     'Classify the user message into exactly one business domain and extract query '
@@ -188,8 +193,10 @@ class MercasDomainChatMixin(models.AbstractModel):
         # create_date alone would keep them in their pre-existing (newest-first) relative
         # order — i.e. the assistant reply would render above the user question that
         # triggered it. Break ties by id, same as ai.bot.conversation.get_recent_messages().
+        # Unsaved messages (no create_date yet) sort as "now"; read the clock once.
+        now = fields.Datetime.now()
         ordered = conversation.message_ids.sorted(
-            lambda m: (m.create_date or fields.Datetime.now(), m.id)
+            lambda m: (m.create_date or now, m.id)
         )
         entries = [
             {'role': msg.role, 'content': msg.content}
@@ -341,22 +348,20 @@ class MercasDomainChatMixin(models.AbstractModel):
                 'group_by': group_by if group_by in _AMOUNT_GROUP_BY else 'customer',
             }
         if domain_key == 'facturacion':
-            allowed = _AMOUNT_GROUP_BY | {'detail'}
             return {
                 'partner': parsed.get('partner'),
                 'product': parsed.get('product'),
                 'date_from': date_from, 'date_to': date_to,
-                'group_by': group_by if group_by in allowed else 'customer',
+                'group_by': group_by if group_by in _INVOICE_GROUP_BY else 'customer',
                 'move_type': parsed.get('move_type') or 'all',
                 'pending': bool(parsed.get('pending')),
             }
         if domain_key == 'stock':
-            allowed = {'product', 'day', 'product_day', 'total'}
             return {
                 'product': parsed.get('product'),
                 'only_boxes': bool(parsed.get('only_boxes')),
                 'date_from': date_from, 'date_to': date_to,
-                'group_by': group_by if group_by in allowed else 'product',
+                'group_by': group_by if group_by in _STOCK_GROUP_BY else 'product',
                 'direction': parsed.get('direction'),
             }
         if domain_key == 'existencias':
@@ -515,7 +520,6 @@ class MercasDomainChatMixin(models.AbstractModel):
             # for 1 useful one; if everything is 0, show that plainly instead.
             nonzero = [r for r in rows if r.get('qty')]
             shown = nonzero or rows
-            separator = '\n' + '-' * 30 + '\n'
 
             if result.get('general'):
                 if not shown:
@@ -534,7 +538,7 @@ class MercasDomainChatMixin(models.AbstractModel):
                     })
                     blocks.append('\n'.join(block_lines))
                 return _('Productos con existencias (los que más stock tienen primero):') \
-                    + '\n\n' + separator.join(blocks)
+                    + '\n\n' + _BLOCK_SEPARATOR.join(blocks)
 
             # Un producto concreto puede tener varios lotes en stock a la vez
             # (distintas entradas de compra) -- agrupados aquí por su propio
@@ -575,7 +579,7 @@ class MercasDomainChatMixin(models.AbstractModel):
                     })
                 blocks.append('\n'.join(lines))
 
-            text = separator.join(blocks)
+            text = _BLOCK_SEPARATOR.join(blocks)
             uoms = {row['uom'] for row in shown}
             if len(shown) > 1 and len(uoms) == 1:
                 total = sum(row['qty'] for row in shown)
@@ -635,8 +639,7 @@ class MercasDomainChatMixin(models.AbstractModel):
                             }
                         )
                 blocks.append('\n'.join(lines))
-            separator = '\n' + '-' * 30 + '\n'
-            return separator.join(blocks)
+            return _BLOCK_SEPARATOR.join(blocks)
 
         if domain_key == 'stock':
             rows = sorted(result.get('rows') or [], key=lambda r: r.get('qty', 0), reverse=True)
@@ -686,7 +689,6 @@ class MercasDomainChatMixin(models.AbstractModel):
                 domain_key == 'compras'
                 or (domain_key == 'facturacion' and result.get('move_type') != 'customer')
             )
-            separator = '\n' + '-' * 30 + '\n'
             blocks = []
             for row in rows:
                 uom = esc(row.get('uom') or '')
@@ -717,7 +719,7 @@ class MercasDomainChatMixin(models.AbstractModel):
                             's': row.get('lot_stock', 0.0), 'uom': uom,
                         })
                 blocks.append('\n'.join(lines))
-            return summary + '\n\n' + separator.join(blocks)
+            return summary + '\n\n' + _BLOCK_SEPARATOR.join(blocks)
 
         if result.get('invoice_detail'):
             rows = result.get('rows') or []
@@ -7,12 +7,13 @@ class AccountMove(models.Model):
 
     def action_post(self):
         result = super().action_post()
-        for move in self:
-            if move.move_type not in ("in_invoice", "in_refund"):
-                continue
-            lots = move.invoice_line_ids.lot_id
-            if lots:
-                lots._mercas_recompute_invoiced_status()
+        # Recompute every lot of the posted vendor bills/refunds in one go, so
+        # a lot shared by several bills is only evaluated once.
+        lots = self.filtered(
+            lambda m: m.move_type in ("in_invoice", "in_refund")
+        ).invoice_line_ids.lot_id
+        if lots:
+            lots._mercas_recompute_invoiced_status()
         return result
 
     def action_compensate(self):
@@ -7,7 +7,7 @@ class AccountMoveLine(models.Model):
     lot_id = fields.Many2one(
         comodel_name="stock.lot",
         string="Lote",
-        index=True,
+        index="btree_not_null",
         ondelete="set null",
     )
     mercas_is_firm_line = fields.Boolean(
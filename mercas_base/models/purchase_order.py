@@ -68,12 +68,12 @@ class PurchaseOrder(models.Model):
 
         result = super().button_confirm()
 
-        # Sync partner to all lots on confirmed lines that still lack it
+        # Sync partner to all lots on confirmed lines that still lack it, in
+        # one write per order rather than one per lot.
         for order in self:
-            for line in order.order_line.filtered(
-                lambda l: l.lot_id and not l.lot_id.partner_id
-            ):
-                line.lot_id.partner_id = order.partner_id
+            order.order_line.lot_id.filtered(
+                lambda lot: not lot.partner_id
+            ).partner_id = order.partner_id
 
         return result
 
@@ -89,41 +89,16 @@ class PurchaseOrder(models.Model):
         product_lines = self.order_line.filtered(
             lambda l: not l.display_type and not l.box_purchase_line_id
         )
-        has_productos = self.order_line.filtered(
-            lambda l: l.display_type == "line_section" and l.name == "PRODUCTOS"
-        )
+        has_productos, has_envases = self._mercas_get_box_sections()
         box_lines_needed = product_lines.filtered(
             lambda l: l.box_qty > 0 and l.box_product_id
         )
         if not product_lines or (not box_lines_needed and not has_productos):
             return
 
-        # --- PRODUCTOS section ---
-        if has_productos:
-            productos_section = has_productos[0]
-        else:
-            productos_section = PurchaseLine.create({
-                "order_id": self.id,
-                "display_type": "line_section",
-                "name": "PRODUCTOS",
-                "sequence": 0,
-                "product_qty": 0,
-            })
-
-        # --- Envases section ---
-        has_envases = self.order_line.filtered(
-            lambda l: l.display_type == "line_section" and l.name == "Envases"
-        )
-        if has_envases:
-            envases_section = has_envases[0]
-        else:
-            envases_section = PurchaseLine.create({
-                "order_id": self.id,
-                "display_type": "line_section",
-                "name": "Envases",
-                "sequence": 0,
-                "product_qty": 0,
-            })
+        # --- PRODUCTOS / Envases sections ---
+        productos_section = has_productos or self._mercas_create_box_section("PRODUCTOS")
+        envases_section = has_envases or self._mercas_create_box_section("Envases")
 
         # --- Create / update box lines ---
         existing_by_parent = {
@@ -146,6 +121,27 @@ class PurchaseOrder(models.Model):
 
         self._mercas_reorder_box_sections(productos_section, envases_section)
 
+    def _mercas_get_box_sections(self):
+        """PRODUCTOS and Envases section lines of the order (empty if
+        missing), picked out in a single pass over its lines."""
+        sections = self.order_line.filtered(
+            lambda l: l.display_type == "line_section"
+            and l.name in ("PRODUCTOS", "Envases")
+        )
+        return (
+            sections.filtered(lambda l: l.name == "PRODUCTOS")[:1],
+            sections.filtered(lambda l: l.name == "Envases")[:1],
+        )
+
+    def _mercas_create_box_section(self, name):
+        return self.env["purchase.order.line"].create({
+            "order_id": self.id,
+            "display_type": "line_section",
+            "name": name,
+            "sequence": 0,
+            "product_qty": 0,
+        })
+
     def _mercas_reorder_box_sections(self, productos_section, envases_section):
         """Renumber sequence so every line sits inside its section: PRODUCTOS,
         then all product lines (keeping their current relative order), then
@@ -175,17 +171,26 @@ class PurchaseOrder(models.Model):
 
     def _mercas_autocreate_lots(self):
         """Auto-assign new lots to tracked lines that have no lot set."""
-        Lot = self.env["stock.lot"]
-        for line in self.order_line:
-            if line.product_id.tracking in ("lot", "serial") and not line.lot_id:
-                line.lot_id = Lot.create({
-                    "product_id": line.product_id.id,
-                    "company_id": self.company_id.id,
-                    "partner_id": self.partner_id.id,
-                    "origin_country_id": line.origin_country_id.id,
-                    "origin_state_id": line.origin_state_id.id,
-                    "mercas_firm_negotiation": line.mercas_firm_negotiation,
-                })
+        lines = self.order_line.filtered(
+            lambda l: l.product_id.tracking in ("lot", "serial") and not l.lot_id
+        )
+        if not lines:
+            return
+        # All the lots of the order in a single create, then link each one to
+        # its line.
+        lots = self.env["stock.lot"].create([
+            {
+                "product_id": line.product_id.id,
+                "company_id": self.company_id.id,
+                "partner_id": self.partner_id.id,
+                "origin_country_id": line.origin_country_id.id,
+                "origin_state_id": line.origin_state_id.id,
+                "mercas_firm_negotiation": line.mercas_firm_negotiation,
+            }
+            for line in lines
+        ])
+        for line, lot in zip(lines, lots):
+            line.lot_id = lot
 
     def action_mercas_box_receive_and_invoice(self):
         """Button target: receive the boxes and invoice the supplier now, for a
@@ -266,13 +271,14 @@ class PurchaseOrder(models.Model):
 class PurchaseOrderLine(models.Model):
     _inherit = "purchase.order.line"
 
+    lot_id = fields.Many2one(index="btree_not_null")
     box_qty = fields.Integer(string="Cajas", default=0)
     box_purchase_line_id = fields.Many2one(
         comodel_name="purchase.order.line",
         string="Línea de producto",
         ondelete="cascade",
         copy=False,
-        index=True,
+        index="btree_not_null",
     )
     box_product_id = fields.Many2one(
         comodel_name="product.product",
@@ -330,36 +336,37 @@ class PurchaseOrderLine(models.Model):
         # button_confirm applies on first confirm -- lot autocreation and
         # PRODUCTOS/Envases classification -- otherwise it's left untracked
         # and out of both sections.
-        trigger_lines = lines.filtered(
+        lines.filtered(
             lambda l: not l.display_type and not l.box_purchase_line_id
-        )
-        confirmed_orders = trigger_lines.order_id.filtered(
+        )._mercas_refresh_confirmed_orders()
+        return lines
+
+    def _mercas_refresh_confirmed_orders(self, autocreate_lots=True):
+        """Re-apply what button_confirm does on first confirm (lot
+        autocreation, PRODUCTOS/Envases layout) to the already confirmed
+        orders of these product lines."""
+        confirmed_orders = self.order_id.filtered(
             lambda o: o.state in ("purchase", "done")
         )
         for order in confirmed_orders:
-            if order.company_id.purchase_lot_autocomplete:
+            if autocreate_lots and order.company_id.purchase_lot_autocomplete:
                 order._mercas_autocreate_lots()
             order._mercas_prepare_box_lines()
-        return lines
 
     def write(self, vals):
         result = super().write(vals)
         if "lot_id" in vals and vals.get("lot_id"):
-            for line in self.filtered(lambda l: l.lot_id and not l.lot_id.partner_id):
-                line.lot_id.partner_id = line.order_id.partner_id
-            for line in self.filtered(
-                lambda l: l.lot_id and (l.origin_country_id or l.origin_state_id)
-            ):
-                update = {}
+            # Everything the new lot inherits from its line (supplier, origin,
+            # firm negotiation) goes in one write per line instead of three.
+            for line in self.filtered(lambda l: l.lot_id):
+                update = {"mercas_firm_negotiation": line.mercas_firm_negotiation}
+                if not line.lot_id.partner_id:
+                    update["partner_id"] = line.order_id.partner_id.id
                 if line.origin_country_id:
                     update["origin_country_id"] = line.origin_country_id.id
                 if line.origin_state_id:
                     update["origin_state_id"] = line.origin_state_id.id
-                line.lot_id.write(update)
-            for line in self.filtered(lambda l: l.lot_id):
-                line.lot_id.with_context(mercas_propagate_firm_negotiation=True).write(
-                    {"mercas_firm_negotiation": line.mercas_firm_negotiation}
-                )
+                line.lot_id.with_context(mercas_propagate_firm_negotiation=True).write(update)
         if "origin_country_id" in vals or "origin_state_id" in vals:
             for line in self.filtered(lambda l: l.lot_id):
                 update = {}
@@ -369,9 +376,13 @@ class PurchaseOrderLine(models.Model):
                     update["origin_state_id"] = line.origin_state_id.id or False
                 line.lot_id.write(update)
         if "mercas_firm_negotiation" in vals:
-            for line in self.filtered(lambda l: l.lot_id):
-                line.lot_id.with_context(mercas_propagate_firm_negotiation=True).write(
-                    {"mercas_firm_negotiation": line.mercas_firm_negotiation}
+            # Every line now holds the written value: push it in a single
+            # write, and only to the lots that don't have it yet.
+            firm = bool(vals["mercas_firm_negotiation"])
+            lots = self.lot_id.filtered(lambda lot: lot.mercas_firm_negotiation != firm)
+            if lots:
+                lots.with_context(mercas_propagate_firm_negotiation=True).write(
+                    {"mercas_firm_negotiation": firm}
                 )
         if "box_qty" in vals or "box_product_id" in vals or "product_id" in vals:
             lines_to_check = self.filtered(lambda l: not l.display_type and not l.box_purchase_line_id)
@@ -382,16 +393,11 @@ class PurchaseOrderLine(models.Model):
                 all_box_lines = self.env["purchase.order.line"].search(
                     [("box_purchase_line_id", "in", lines_to_check.ids)]
                 )
-                box_lines_by_parent = {}
-                for box_line in all_box_lines:
-                    box_lines_by_parent.setdefault(
-                        box_line.box_purchase_line_id.id, self.env["purchase.order.line"]
-                    )
-                    box_lines_by_parent[box_line.box_purchase_line_id.id] |= box_line
+                box_lines_by_parent = all_box_lines.grouped("box_purchase_line_id")
 
                 to_unlink = self.env["purchase.order.line"]
                 for line in lines_to_check:
-                    box_lines = box_lines_by_parent.get(line.id)
+                    box_lines = box_lines_by_parent.get(line)
                     if not box_lines:
                         continue
                     if "box_qty" in vals and line.box_qty == 0:
@@ -411,11 +417,7 @@ class PurchaseOrderLine(models.Model):
                 # (or a product change that gives it one) needs its box line
                 # created, same as create() -- write() above only updates lines
                 # that already had one.
-                confirmed_orders = lines_to_check.order_id.filtered(
-                    lambda o: o.state in ("purchase", "done")
+                lines_to_check._mercas_refresh_confirmed_orders(
+                    autocreate_lots="product_id" in vals
                 )
-                for order in confirmed_orders:
-                    if "product_id" in vals and order.company_id.purchase_lot_autocomplete:
-                        order._mercas_autocreate_lots()
-                    order._mercas_prepare_box_lines()
         return result
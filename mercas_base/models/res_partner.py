@@ -79,14 +79,19 @@ class ResPartner(models.Model):
 
         qty_by_location = {}
         if all_location_ids:
-            quants = self.env["stock.quant"].search([
-                ("location_id", "in", list(all_location_ids)),
-                ("product_id.is_box", "=", True),
-                ("quantity", "!=", 0),
-            ])
-            for quant in quants:
-                loc_id = quant.location_id.id
-                qty_by_location[loc_id] = qty_by_location.get(loc_id, 0.0) + quant.quantity
+            # Summed per location in SQL rather than loading every box quant.
+            qty_by_location = {
+                location.id: quantity
+                for location, quantity in self.env["stock.quant"]._read_group(
+                    [
+                        ("location_id", "in", list(all_location_ids)),
+                        ("product_id.is_box", "=", True),
+                        ("quantity", "!=", 0),
+                    ],
+                    ["location_id"],
+                    ["quantity:sum"],
+                )
+            }
 
         for partner in self:
             locations = locations_by_partner[partner.id]
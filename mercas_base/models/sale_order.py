@@ -101,39 +101,16 @@ class SaleOrder(models.Model):
         product_lines = self.order_line.filtered(
             lambda l: not l.display_type and not l.box_sale_line_id
         )
-        has_productos = self.order_line.filtered(
-            lambda l: l.display_type == "line_section" and l.name == "PRODUCTOS"
-        )
+        has_productos, has_envases = self._mercas_get_box_sections()
         box_lines_needed = product_lines.filtered(
             lambda l: l.box_qty > 0 and l.box_product_id
         )
         if not product_lines or (not box_lines_needed and not has_productos):
             return
 
-        # --- PRODUCTOS section ---
-        if has_productos:
-            productos_section = has_productos[0]
-        else:
-            productos_section = SaleLine.create({
-                "order_id": self.id,
-                "display_type": "line_section",
-                "name": "PRODUCTOS",
-                "sequence": 0,
-            })
-
-        # --- Envases section ---
-        has_envases = self.order_line.filtered(
-            lambda l: l.display_type == "line_section" and l.name == "Envases"
-        )
-        if has_envases:
-            envases_section = has_envases[0]
-        else:
-            envases_section = SaleLine.create({
-                "order_id": self.id,
-                "display_type": "line_section",
-                "name": "Envases",
-                "sequence": 0,
-            })
+        # --- PRODUCTOS / Envases sections ---
+        productos_section = has_productos or self._mercas_create_box_section("PRODUCTOS")
+        envases_section = has_envases or self._mercas_create_box_section("Envases")
 
         # --- Create / update box lines ---
         existing_by_parent = {
@@ -156,6 +133,26 @@ class SaleOrder(models.Model):
 
         self._mercas_reorder_box_sections(productos_section, envases_section)
 
+    def _mercas_get_box_sections(self):
+        """PRODUCTOS and Envases section lines of the order (empty if
+        missing), picked out in a single pass over its lines."""
+        sections = self.order_line.filtered(
+            lambda l: l.display_type == "line_section"
+            and l.name in ("PRODUCTOS", "Envases")
+        )
+        return (
+            sections.filtered(lambda l: l.name == "PRODUCTOS")[:1],
+            sections.filtered(lambda l: l.name == "Envases")[:1],
+        )
+
+    def _mercas_create_box_section(self, name):
+        return self.env["sale.order.line"].create({
+            "order_id": self.id,
+            "display_type": "line_section",
+            "name": name,
+            "sequence": 0,
+        })
+
     def _mercas_reorder_box_sections(self, productos_section, envases_section):
         """Renumber sequence so every line sits inside its section: PRODUCTOS,
         then all product lines (keeping their current relative order), then
@@ -169,19 +166,28 @@ class SaleOrder(models.Model):
         }
 
         seq = 0
-        productos_section.sequence = seq
+        new_sequences = [(productos_section, seq)]
         for line in product_lines:
             seq += 10
-            line.sequence = seq
+            new_sequences.append((line, seq))
 
         seq += 10
-        envases_section.sequence = seq
+        new_sequences.append((envases_section, seq))
 
         for line in product_lines:
             box_line = box_lines_by_parent.get(line.id)
             if box_line:
                 seq += 10
-                box_line.sequence = seq
+                new_sequences.append((box_line, seq))
+
+        # Each line gets its own sequence, so it's still one write per moved
+        # line, but the bus notification to open order forms is sent once for
+        # the whole renumbering instead of once per line.
+        moved = [(line, seq) for line, seq in new_sequences if line.sequence != seq]
+        for line, seq in moved:
+            line.with_context(mercas_defer_lines_notify=True).sequence = seq
+        if moved:
+            self.env["sale.order.line"]._mercas_notify_lines_changed(self)
 
     def button_sold_and_sent(self):
         """Confirm the sale and immediately validate the delivery if all lots are assigned."""
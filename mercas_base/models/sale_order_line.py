@@ -6,6 +6,9 @@ MERCAS_LINES_BUS_NOTIFICATION_TYPE = "mercas_sale_order_lines_updated"
 class SaleOrderLine(models.Model):
     _inherit = "sale.order.line"
 
+    # Lots look up their order lines by lot_id (the purchase.order.line
+    # override indexes it the same way).
+    lot_id = fields.Many2one(index="btree_not_null")
     box_qty = fields.Integer(
         string="Cajas",
         compute="_compute_box_qty",
@@ -17,7 +20,7 @@ class SaleOrderLine(models.Model):
         string="Línea de producto",
         ondelete="cascade",
         copy=False,
-        index=True,
+        index="btree_not_null",
     )
     box_product_id = fields.Many2one(
         comodel_name="product.product",
@@ -72,15 +75,19 @@ class SaleOrderLine(models.Model):
         # A product line added after confirmation needs the same PRODUCTOS/
         # Envases classification that action_confirm applies on first
         # confirm -- otherwise it's left out of both sections.
-        trigger_lines = lines.filtered(
+        lines.filtered(
             lambda l: not l.display_type and not l.box_sale_line_id
-        )
-        confirmed_orders = trigger_lines.order_id.filtered(
+        )._mercas_refresh_confirmed_orders()
+        return lines
+
+    def _mercas_refresh_confirmed_orders(self):
+        """Re-apply the PRODUCTOS/Envases layout of action_confirm to the
+        already confirmed orders of these product lines."""
+        confirmed_orders = self.order_id.filtered(
             lambda o: o.state in ("sale", "done")
         )
         for order in confirmed_orders:
             order._mercas_prepare_box_lines()
-        return lines
 
     @api.depends("product_id", "product_uom_id", "product_uom_qty")
     def _compute_box_qty(self):
@@ -145,16 +152,11 @@ class SaleOrderLine(models.Model):
                 all_box_lines = self.env["sale.order.line"].search(
                     [("box_sale_line_id", "in", lines_to_check.ids)]
                 )
-                box_lines_by_parent = {}
-                for box_line in all_box_lines:
-                    box_lines_by_parent.setdefault(
-                        box_line.box_sale_line_id.id, self.env["sale.order.line"]
-                    )
-                    box_lines_by_parent[box_line.box_sale_line_id.id] |= box_line
+                box_lines_by_parent = all_box_lines.grouped("box_sale_line_id")
 
                 to_unlink = self.env["sale.order.line"]
                 for line in lines_to_check:
-                    box_lines = box_lines_by_parent.get(line.id)
+                    box_lines = box_lines_by_parent.get(line)
                     if not box_lines:
                         continue
                     if "box_qty" in vals and line.box_qty == 0:
@@ -174,11 +176,7 @@ class SaleOrderLine(models.Model):
                 # (or a product change that gives it one) needs its box line
                 # created, same as create() -- write() above only updates lines
                 # that already had one.
-                confirmed_orders = lines_to_check.order_id.filtered(
-                    lambda o: o.state in ("sale", "done")
-                )
-                for order in confirmed_orders:
-                    order._mercas_prepare_box_lines()
+                lines_to_check._mercas_refresh_confirmed_orders()
         self._mercas_notify_lines_changed(self.order_id)
         return result
 
@@ -192,14 +190,19 @@ class SaleOrderLine(models.Model):
         """Avisa por el bus a quien tenga abierto alguno de estos pedidos de
         que sus líneas han cambiado, para que pueda ofrecer recargar la vista
         (ver static/src/js/sale_order_lines_bus_notification.js)."""
+        if self.env.context.get("mercas_defer_lines_notify"):
+            # Quien escribe en bloque avisa una sola vez al terminar.
+            return
+        Bus = self.env["bus.bus"]
+        user = self.env.user
         for order in orders:
-            self.env["bus.bus"]._sendone(
+            Bus._sendone(
                 self._mercas_lines_bus_channel(order.id),
                 MERCAS_LINES_BUS_NOTIFICATION_TYPE,
                 {
                     "order_id": order.id,
-                    "user_id": self.env.user.id,
-                    "user_name": self.env.user.name,
+                    "user_id": user.id,
+                    "user_name": user.name,
                 },
             )
 
@@ -441,11 +441,20 @@ class StockLot(models.Model):
 
     @api.depends("purchase_line_ids.product_qty", "purchase_line_ids.order_id.state")
     def _compute_purchase_kg(self):
-        for lot in self:
-            lines = lot.purchase_line_ids.filtered(
-                lambda l: l.order_id.state in ("purchase", "done")
+        # Summed in SQL for the whole batch instead of loading every purchase
+        # line (and its order) of each lot to add up one column.
+        kg_by_lot = dict(
+            self.env["purchase.order.line"]._read_group(
+                [
+                    ("lot_id", "in", self.ids),
+                    ("order_id.state", "in", ("purchase", "done")),
+                ],
+                ["lot_id"],
+                ["product_qty:sum"],
             )
-            lot.purchase_kg = sum(lines.mapped("product_qty"))
+        )
+        for lot in self:
+            lot.purchase_kg = kg_by_lot.get(lot._origin, 0.0)
 
     @api.depends(
         "stock_move_line_ids.quantity",
@@ -494,16 +503,7 @@ class StockLot(models.Model):
         for lot in self:
             lot.can_edit_margin = is_manager
 
-    @api.depends(
-        "stock_move_line_ids.quantity",
-        "stock_move_line_ids.state",
-        "stock_move_line_ids.move_id.sale_line_id",
-        "stock_move_line_ids.move_id.sale_line_id.price_unit",
-        "stock_move_line_ids.move_id.sale_line_id.discount",
-        "purchase_line_ids.product_qty",
-        "purchase_line_ids.order_id.state",
-        "mercas_margin",
-    )
+    @api.depends("sale_amount", "purchase_kg", "mercas_margin")
     def _compute_supplier_fields(self):
         for lot in self:
             supplier_amount = lot.sale_amount * (1.0 - lot.mercas_margin / 100.0)
@@ -544,13 +544,14 @@ class StockLot(models.Model):
         purchase_line = self.purchase_line_ids.filtered(
             lambda l: l.order_id.state in ("purchase", "done")
         )[:1]
+        order = purchase_line.order_id
         parts = []
-        if purchase_line and purchase_line.order_id.date_order:
-            parts.append(purchase_line.order_id.date_order.strftime("%d/%m/%Y"))
-        if purchase_line and purchase_line.order_id.name:
-            parts.append(purchase_line.order_id.name)
-        if purchase_line and purchase_line.order_id.partner_ref:
-            parts.append(purchase_line.order_id.partner_ref)
+        if order.date_order:
+            parts.append(order.date_order.strftime("%d/%m/%Y"))
+        if order.name:
+            parts.append(order.name)
+        if order.partner_ref:
+            parts.append(order.partner_ref)
         parts.append(self.name)
         return " | ".join(parts), purchase_line
 
@@ -692,12 +693,14 @@ class StockLot(models.Model):
                 "name": scrap_name,
             }))
 
-        prior_moves = self.supplier_invoice_line_ids.filtered(
+        # Líneas agrupadas por factura en una sola pasada, en vez de volver a
+        # filtrar todas las líneas del lote para cada factura previa.
+        prior_lines = self.supplier_invoice_line_ids.filtered(
             lambda l: l.move_id.state == "posted"
-        ).mapped("move_id").sorted("invoice_date")
-        for move in prior_moves:
-            move_lines = self.supplier_invoice_line_ids.filtered(lambda l: l.move_id == move)
-            contribution = sum(move_lines.mapped("price_subtotal"))
+        )
+        prior_lines_by_move = prior_lines.grouped("move_id")
+        for move in prior_lines.move_id.sorted("invoice_date"):
+            contribution = sum(prior_lines_by_move[move].mapped("price_subtotal"))
             if move.move_type == "in_refund":
                 contribution = -contribution
             if not contribution:
@@ -738,13 +741,8 @@ class StockLot(models.Model):
                 % ", ".join(with_draft.mapped("name"))
             )
 
-        by_partner = {}
-        for lot in lots:
-            by_partner.setdefault(lot.partner_id.id, self.env["stock.lot"])
-            by_partner[lot.partner_id.id] |= lot
-
         invoices = self.env["account.move"]
-        for partner_id, partner_lots in by_partner.items():
+        for partner, partner_lots in lots.grouped("partner_id").items():
             lines = []
             for lot in partner_lots:
                 lines += lot._mercas_prepare_invoice_lines()
@@ -753,7 +751,7 @@ class StockLot(models.Model):
 
             invoice = self.env["account.move"].create({
                 "move_type": "in_invoice",
-                "partner_id": partner_id,
+                "partner_id": partner.id,
                 "invoice_date": fields.Date.context_today(self),
                 "invoice_line_ids": lines,
             })
@@ -806,19 +804,22 @@ class StockLot(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        for vals in vals_list:
-            if "mercas_margin" not in vals:
-                partner_id = vals.get("partner_id")
+        missing = [vals for vals in vals_list if "mercas_margin" not in vals]
+        if missing:
+            # Browse every supplier and company of the batch together so their
+            # margins are prefetched in one read each, not one per lot.
+            partners = self.env["res.partner"].browse(
+                {vals["partner_id"] for vals in missing if vals.get("partner_id")}
+            )
+            companies = self.env["res.company"].browse(
+                filter(None, {vals.get("company_id", self.env.company.id) for vals in missing})
+            )
+            margin_by_partner = {p.id: p.mercas_margin for p in partners}
+            margin_by_company = {c.id: c.mercas_margin for c in companies}
+            for vals in missing:
                 company_id = vals.get("company_id", self.env.company.id)
-                partner = (
-                    self.env["res.partner"].browse(partner_id)
-                    if partner_id
-                    else self.env["res.partner"]
-                )
-                company = self.env["res.company"].browse(company_id)
                 vals["mercas_margin"] = (
-                    partner.mercas_margin
-                    if partner and partner.mercas_margin
-                    else company.mercas_margin
+                    margin_by_partner.get(vals.get("partner_id"))
+                    or margin_by_company.get(company_id, 0.0)
                 )
         return super().create(vals_list)
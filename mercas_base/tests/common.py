@@ -0,0 +1,39 @@
+from odoo import Command
+from odoo.tests import TransactionCase
+
+from odoo.addons.base.tests.common import DISABLED_MAIL_CONTEXT
+
+
+class MercasLotCommon(TransactionCase):
+    """Datos maestros comunes a los tests de lotes: proveedor, cliente y un
+    producto en kg con seguimiento por lote y sin impuestos (para que los
+    importes de las facturas cuadren con los precios sin más cálculo).
+
+    Cada clase de test fija `_mercas_label` para que sus registros sigan
+    siendo identificables en la base de datos de pruebas.
+
+    Se desactiva el seguimiento del chatter (tracking, logs de creación,
+    suscripciones): lotes, pedidos y facturas heredan de mail.thread y
+    ningún test de lotes comprueba mensajes, así que solo sería coste."""
+
+    _mercas_label = "Lote"
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env = cls.env(context=dict(cls.env.context, **DISABLED_MAIL_CONTEXT))
+        cls.company = cls.env.company
+        cls.uom_kg = cls.env.ref("uom.product_uom_kgm")
+        cls.supplier, cls.customer = cls.env["res.partner"].create([
+            {"name": "Proveedor %s" % cls._mercas_label},
+            {"name": "Cliente %s" % cls._mercas_label},
+        ])
+        cls.product = cls.env["product.product"].create({
+            "name": "Producto %s" % cls._mercas_label,
+            "type": "consu",
+            "is_storable": True,
+            "tracking": "lot",
+            "uom_id": cls.uom_kg.id,
+            "taxes_id": [Command.clear()],
+            "supplier_taxes_id": [Command.clear()],
+        })
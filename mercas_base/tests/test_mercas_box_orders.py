@@ -105,62 +105,53 @@ class TestMercasBoxOrders(TransactionCase):
         pending = so.picking_ids.filtered(lambda p: p.state not in ("done", "cancel"))
         self.assertTrue(pending)
 
-    # --- Botón explícito "Recibir y facturar" ---
-
-    def test_purchase_action_receive_and_invoice(self):
-        po = self._box_purchase()
-        po.button_confirm()
-        po.action_mercas_box_receive_and_invoice()
-        pending = po.picking_ids.filtered(lambda p: p.state not in ("done", "cancel"))
-        self.assertFalse(pending)
-        posted_invoices = po.invoice_ids.filtered(lambda i: i.state == "posted")
-        self.assertTrue(posted_invoices)
-
-    def test_sale_action_deliver_and_invoice(self):
-        so = self._box_sale()
-        so.action_confirm()
-        so.action_mercas_box_deliver_and_invoice()
-        pending = so.picking_ids.filtered(lambda p: p.state not in ("done", "cancel"))
-        self.assertFalse(pending)
-        posted_invoices = so.invoice_ids.filtered(lambda i: i.state == "posted")
-        self.assertTrue(posted_invoices)
-
-    # --- Atajos "hazlo todo ahora" siguen procesando de punta a punta ---
-
-    def test_purchase_button_purchase_and_receive_still_processes_box_order(self):
-        po = self._box_purchase()
-        po.button_purchase_and_receive()
-        pending = po.picking_ids.filtered(lambda p: p.state not in ("done", "cancel"))
-        self.assertFalse(pending)
-        posted_invoices = po.invoice_ids.filtered(lambda i: i.state == "posted")
-        self.assertTrue(posted_invoices)
-
-    def test_sale_button_sold_and_sent_still_processes_box_order(self):
-        so = self._box_sale()
-        so.button_sold_and_sent()
-        pending = so.picking_ids.filtered(lambda p: p.state not in ("done", "cancel"))
-        self.assertFalse(pending)
-        posted_invoices = so.invoice_ids.filtered(lambda i: i.state == "posted")
-        self.assertTrue(posted_invoices)
-
-    # --- Los botones "Entrega cajas"/"Devolución cajas" requieren que exista
-    #     al menos un producto marcado como caja ---
-
-    def test_action_open_box_delivery_requires_a_box_product_configured(self):
+    # --- Botón explícito "Recibir y facturar" y atajos "hazlo todo ahora":
+    #     todos procesan el pedido de cajas de punta a punta ---
+
+    def test_box_flows_process_and_invoice(self):
+        flows = [
+            ("purchase_receive_and_invoice", self._box_purchase,
+             ("button_confirm", "action_mercas_box_receive_and_invoice")),
+            ("sale_deliver_and_invoice", self._box_sale,
+             ("action_confirm", "action_mercas_box_deliver_and_invoice")),
+            ("purchase_and_receive", self._box_purchase,
+             ("button_purchase_and_receive",)),
+            ("sold_and_sent", self._box_sale,
+             ("button_sold_and_sent",)),
+        ]
+        for name, make_order, buttons in flows:
+            with self.subTest(flow=name):
+                order = make_order()
+                for button in buttons:
+                    getattr(order, button)()
+                pending = order.picking_ids.filtered(
+                    lambda p: p.state not in ("done", "cancel")
+                )
+                self.assertFalse(pending)
+                posted_invoices = order.invoice_ids.filtered(lambda i: i.state == "posted")
+                self.assertTrue(posted_invoices)
+
+    # --- Los botones "Entrega cajas"/"Devolución cajas" (pedido y ficha de
+    #     contacto) requieren que exista al menos un producto marcado como caja ---
+
+    def test_box_buttons_require_a_box_product_configured(self):
         # Desmarca cualquier producto de caja existente (no solo el propio de
         # este test), para que la comprobación sea válida aunque haya otros
         # box products creados por otro módulo instalado a la vez (p. ej. datos
-        # de demo).
+        # de demo). Todos los botones comparten la misma precondición, así que
+        # se comprueban juntos sobre un único estado en vez de repetirlo por test.
         self.env["product.template"].search([("is_box", "=", True)]).is_box = False
         po = self.env["purchase.order"].create({"partner_id": self.supplier.id})
-        with self.assertRaises(UserError):
-            po.action_open_box_delivery()
-
-    def test_action_open_box_return_requires_a_box_product_configured(self):
-        self.env["product.template"].search([("is_box", "=", True)]).is_box = False
         so = self.env["sale.order"].create({"partner_id": self.customer.id})
-        with self.assertRaises(UserError):
-            so.action_open_box_return()
+        buttons = {
+            "purchase.action_open_box_delivery": po.action_open_box_delivery,
+            "sale.action_open_box_return": so.action_open_box_return,
+            "partner.action_mercas_open_box_delivery": self.supplier.action_mercas_open_box_delivery,
+            "partner.action_mercas_open_box_return": self.customer.action_mercas_open_box_return,
+        }
+        for name, button in buttons.items():
+            with self.subTest(button=name), self.assertRaises(UserError):
+                button()
 
     # --- mercas_is_box_return/mercas_is_box_delivery son realmente buscables
     #     (campos store=True, no solo legibles) ---
@@ -206,10 +197,3 @@ class TestMercasBoxOrders(TransactionCase):
         self.assertEqual(action["res_model"], "purchase.order")
         new_po = self.env["purchase.order"].browse(action["res_id"])
         self.assertEqual(new_po.partner_id, self.customer)
-
-    def test_partner_box_buttons_require_a_box_product_configured(self):
-        self.env["product.template"].search([("is_box", "=", True)]).is_box = False
-        with self.assertRaises(UserError):
-            self.supplier.action_mercas_open_box_delivery()
-        with self.assertRaises(UserError):
-            self.customer.action_mercas_open_box_return()
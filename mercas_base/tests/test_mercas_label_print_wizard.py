@@ -13,7 +13,10 @@ class TestMercasLabelPrintWizard(TransactionCase):
     def setUpClass(cls):
         super().setUpClass()
         cls.company = cls.env.company
-        cls.supplier = cls.env["res.partner"].create({"name": "Proveedor Etiquetas"})
+        cls.supplier, cls.customer = cls.env["res.partner"].create([
+            {"name": "Proveedor Etiquetas"},
+            {"name": "Cliente Etiquetas"},
+        ])
         cls.uom_kg = cls.env.ref("uom.product_uom_kgm")
 
         cls.box_product = cls.env["product.product"].create({
@@ -102,9 +105,8 @@ class TestMercasLabelPrintWizard(TransactionCase):
             wizard.action_print()
 
     def test_proposes_boxes_from_sale_lines(self):
-        customer = self.env["res.partner"].create({"name": "Cliente Etiquetas"})
         sale = self.env["sale.order"].create({
-            "partner_id": customer.id,
+            "partner_id": self.customer.id,
             "order_line": [
                 Command.create({
                     "product_id": self.platano.id,
@@ -1,3 +1,5 @@
+from freezegun import freeze_time
+
 from odoo import Command, fields
 from odoo.tests import TransactionCase, tagged
 
@@ -14,19 +16,18 @@ class TestSaleOrderLineProductQtyDatetime(TransactionCase):
         })
 
     def test_create_sets_datetime(self):
-        before = fields.Datetime.now()
-        sale = self.env["sale.order"].create({
-            "partner_id": self.customer.id,
-            "order_line": [
-                Command.create({
-                    "product_id": self.product.id,
-                    "product_uom_qty": 10.0,
-                }),
-            ],
-        })
-        after = fields.Datetime.now()
-        self.assertTrue(sale.order_line.product_qty_datetime)
-        self.assertTrue(before <= sale.order_line.product_qty_datetime <= after)
+        now = fields.Datetime.from_string("2025-03-10 08:00:00")
+        with freeze_time(now):
+            sale = self.env["sale.order"].create({
+                "partner_id": self.customer.id,
+                "order_line": [
+                    Command.create({
+                        "product_id": self.product.id,
+                        "product_uom_qty": 10.0,
+                    }),
+                ],
+            })
+        self.assertEqual(sale.order_line.product_qty_datetime, now)
 
     def test_create_does_not_set_datetime_on_section_lines(self):
         sale = self.env["sale.order"].create({
@@ -66,9 +67,12 @@ class TestSaleOrderLineProductQtyDatetime(TransactionCase):
         })
         created_at = sale.order_line.product_qty_datetime
 
-        before = fields.Datetime.now()
-        sale.order_line.product_uom_qty = 25.0
-        after = fields.Datetime.now()
+        # Congelar el reloj en un instante posterior a la creación: así la
+        # comprobación es exacta en lugar de acotar entre dos now() y no
+        # depende de que el test caiga en otro segundo.
+        now = fields.Datetime.add(created_at, minutes=5)
+        with freeze_time(now):
+            sale.order_line.product_uom_qty = 25.0
 
-        self.assertTrue(before <= sale.order_line.product_qty_datetime <= after)
-        self.assertGreaterEqual(sale.order_line.product_qty_datetime, created_at)
+        self.assertEqual(sale.order_line.product_qty_datetime, now)
+        self.assertGreater(sale.order_line.product_qty_datetime, created_at)
@@ -1,45 +1,33 @@
 from odoo import Command
 from odoo.exceptions import UserError
-from odoo.tests import TransactionCase, tagged
+from odoo.tests import tagged
+
+from .common import MercasLotCommon
 
 
 @tagged("post_install", "-at_install")
-class TestStockLotChangeWizard(TransactionCase):
+class TestStockLotChangeWizard(MercasLotCommon):
     """Un usuario asigna por error el lote A a una línea de venta; se
     corrige a mano al lote B correcto con el asistente, tanto si ya se ha
     servido como si el albarán sigue pendiente de validar."""
 
+    _mercas_label = "Corrección Lote"
+
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
-        cls.company = cls.env.company
-        cls.supplier = cls.env["res.partner"].create({"name": "Proveedor Corrección Lote"})
-        cls.customer = cls.env["res.partner"].create({"name": "Cliente Corrección Lote"})
-        cls.uom_kg = cls.env.ref("uom.product_uom_kgm")
-        cls.product = cls.env["product.product"].create({
-            "name": "Producto Corrección Lote",
-            "type": "consu",
-            "is_storable": True,
-            "tracking": "lot",
-            "uom_id": cls.uom_kg.id,
-            "taxes_id": [Command.clear()],
-            "supplier_taxes_id": [Command.clear()],
-        })
+        cls.has_restrict_lot_id = "restrict_lot_id" in cls.env["stock.move"]._fields
 
-        cls.lot_a = cls.env["stock.lot"].create({
-            "name": "LOTE-A",
-            "product_id": cls.product.id,
-            "company_id": cls.company.id,
-            "partner_id": cls.supplier.id,
-            "mercas_margin": 10.0,
-        })
-        cls.lot_b = cls.env["stock.lot"].create({
-            "name": "LOTE-B",
-            "product_id": cls.product.id,
-            "company_id": cls.company.id,
-            "partner_id": cls.supplier.id,
-            "mercas_margin": 10.0,
-        })
+        cls.lot_a, cls.lot_b = cls.env["stock.lot"].create([
+            {
+                "name": name,
+                "product_id": cls.product.id,
+                "company_id": cls.company.id,
+                "partner_id": cls.supplier.id,
+                "mercas_margin": 10.0,
+            }
+            for name in ("LOTE-A", "LOTE-B")
+        ])
         for lot in (cls.lot_a, cls.lot_b):
             purchase = cls.env["purchase.order"].create({
                 "partner_id": cls.supplier.id,
@@ -101,10 +89,10 @@ class TestStockLotChangeWizard(TransactionCase):
         wizard.action_apply()
 
         self.assertEqual(line.lot_id, self.lot_b)
-        self.assertAlmostEqual(self.lot_a.sale_kg, 0.0, places=2)
-        self.assertAlmostEqual(self.lot_b.sale_kg, 500.0, places=2)
-        self.assertAlmostEqual(self.lot_a.sale_amount, 0.0, places=2)
-        self.assertAlmostEqual(self.lot_b.sale_amount, 1000.0, places=2)
+        self.assertRecordValues(self.lot_a | self.lot_b, [
+            {"sale_kg": 0.0, "sale_amount": 0.0},
+            {"sale_kg": 500.0, "sale_amount": 1000.0},
+        ])
 
     def test_wizard_corrects_physical_quants_after_delivery(self):
         sale = self._sell(self.lot_a, 500.0, 2.0)
@@ -193,7 +181,7 @@ class TestStockLotChangeWizard(TransactionCase):
         self.assertEqual(invoice_line.lot_id, self.lot_b)
 
     def test_wizard_updates_restrict_lot_id_if_installed(self):
-        if "restrict_lot_id" not in self.env["stock.move"]._fields:
+        if not self.has_restrict_lot_id:
             self.skipTest("stock_restrict_lot no está instalado")
 
         sale = self._sell(self.lot_a, 500.0, 2.0)
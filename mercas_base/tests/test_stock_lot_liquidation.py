@@ -1,10 +1,12 @@
 from odoo import Command
 from odoo.exceptions import UserError
-from odoo.tests import TransactionCase, tagged
+from odoo.tests import tagged
+
+from .common import MercasLotCommon
 
 
 @tagged("post_install", "-at_install")
-class TestStockLotLiquidation(TransactionCase):
+class TestStockLotLiquidation(MercasLotCommon):
     """Escenario:
 
     Compra estimada de 2000 kg a 1 $/kg. Se venden 1000 kg a 2 $/kg y se
@@ -14,22 +16,11 @@ class TestStockLotLiquidation(TransactionCase):
     liquida el total, descontando el anticipo ya facturado.
     """
 
+    _mercas_label = "Liquidación"
+
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
-        cls.company = cls.env.company
-        cls.supplier = cls.env["res.partner"].create({"name": "Proveedor Liquidación"})
-        cls.customer = cls.env["res.partner"].create({"name": "Cliente Liquidación"})
-        cls.uom_kg = cls.env.ref("uom.product_uom_kgm")
-        cls.product = cls.env["product.product"].create({
-            "name": "Producto Liquidación",
-            "type": "consu",
-            "is_storable": True,
-            "tracking": "lot",
-            "uom_id": cls.uom_kg.id,
-            "taxes_id": [Command.clear()],
-            "supplier_taxes_id": [Command.clear()],
-        })
         cls.lot = cls.env["stock.lot"].create({
             "name": "LOTE-LIQ-TEST",
             "product_id": cls.product.id,
@@ -103,11 +94,13 @@ class TestStockLotLiquidation(TransactionCase):
         self._sell(1000.0, 2.0)
         self._scrap(200.0)
 
-        self.assertAlmostEqual(lot.sale_kg, 1000.0, places=2)
-        self.assertAlmostEqual(lot.sale_amount, 2000.0, places=2)
-        self.assertAlmostEqual(lot.scrap_kg, 200.0, places=2)
-        self.assertFalse(lot.completed)
-        self.assertTrue(lot.invoiceable)
+        self.assertRecordValues(lot, [{
+            "sale_kg": 1000.0,
+            "sale_amount": 2000.0,
+            "scrap_kg": 200.0,
+            "completed": False,
+            "invoiceable": True,
+        }])
 
         gross_qty, gross_price, gross_amount = lot._mercas_liquidation_gross()
         self.assertAlmostEqual(gross_qty, 1200.0, places=2)
@@ -130,12 +123,14 @@ class TestStockLotLiquidation(TransactionCase):
 
         self._sell(800.0, 1.4)
 
-        self.assertTrue(lot.completed)
-        self.assertAlmostEqual(lot.sale_kg, 1800.0, places=2)
-        self.assertAlmostEqual(lot.sale_amount, 3120.0, places=2)
-        self.assertAlmostEqual(lot.supplier_amount, 2808.0, places=2)
-        self.assertAlmostEqual(lot.supplier_price_kg, 1.404, places=4)
-        self.assertTrue(lot.invoiceable)
+        self.assertRecordValues(lot, [{
+            "completed": True,
+            "sale_kg": 1800.0,
+            "sale_amount": 3120.0,
+            "supplier_amount": 2808.0,
+            "supplier_price_kg": 1.404,
+            "invoiceable": True,
+        }])
 
         action = lot.action_create_supplier_invoices()
         final_invoice = self.env["account.move"].browse(action["res_id"])
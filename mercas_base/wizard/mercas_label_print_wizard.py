@@ -76,7 +76,7 @@ class MercasLabelPrintWizard(models.TransientModel):
         xml_id, data = layout._prepare_report_data()
         data["quantity_by_product"] = quantity_by_product
         report_action = self.env.ref(xml_id).report_action(None, data=data, config=False)
-        report_action.update({"close_on_report_download": True})
+        report_action["close_on_report_download"] = True
         return report_action
 
 
@@ -79,20 +79,12 @@ def _assign_taxes(env):
     no son estables entre bases de datos; si la compañía no usa el plan contable
     español (l10n_es) simplemente no se encuentran y no se toca nada.
     """
-    produce_templates = env["product.template"].browse(
-        [
-            env.ref(xmlid).id
-            for xmlid in PRODUCE_TEMPLATE_XMLIDS
-            if env.ref(xmlid, raise_if_not_found=False)
-        ]
-    )
-    box_templates = env["product.template"].browse(
-        [
-            env.ref(xmlid).product_tmpl_id.id
-            for xmlid in BOX_PRODUCT_XMLIDS
-            if env.ref(xmlid, raise_if_not_found=False)
-        ]
+    produce_templates = env["product.template"].union(
+        *filter(None, (env.ref(xmlid, raise_if_not_found=False) for xmlid in PRODUCE_TEMPLATE_XMLIDS))
     )
+    box_templates = env["product.product"].union(
+        *filter(None, (env.ref(xmlid, raise_if_not_found=False) for xmlid in BOX_PRODUCT_XMLIDS))
+    ).product_tmpl_id
 
     for company in env["res.company"].search([]):
         chart = env["account.chart.template"].with_company(company)
@@ -158,6 +158,8 @@ class SaleOrderLine(models.Model):
             if lot
         }
 
+        # product_expiry is optional: check for the field once, not per lot.
+        has_expiration = "expiration_date" in self.env["stock.lot"]._fields
         available = []
         for lot, qty, reserved in quants:
             if not lot:
@@ -170,7 +172,7 @@ class SaleOrderLine(models.Model):
                 continue
 
             expiration_date = False
-            if hasattr(lot, "expiration_date") and lot.expiration_date:
+            if has_expiration and lot.expiration_date:
                 expiration_date = lot.expiration_date.strftime("%Y-%m-%d")
 
             available.append(
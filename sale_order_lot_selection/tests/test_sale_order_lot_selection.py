@@ -1,6 +1,7 @@
 # © 2015 Agile Business Group
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl.html).
 
+from odoo import Command
 from odoo.tests import TransactionCase
 
 
@@ -45,6 +46,9 @@ class TestSaleOrderLotSelection(TransactionCase):
         cls.supplier_location = cls.env.ref("stock.stock_location_suppliers")
         cls.customer_location = cls.env.ref("stock.stock_location_customers")
         cls.stock_location = cls.env.ref("stock.stock_location_stock")
+        cls.picking_type_in = cls.env.ref("stock.picking_type_in")
+        cls.picking_type_out = cls.env.ref("stock.picking_type_out")
+        cls.main_company = cls.env.ref("base.main_company")
         cls.product_model = cls.env["product.product"]
         cls.lot_model = cls.env["stock.lot"]
 
@@ -91,7 +95,7 @@ class TestSaleOrderLotSelection(TransactionCase):
             {
                 "name": "test2",
                 "product_id": self.prd_cable.id,
-                "company_id": self.env.ref("base.main_company").id,
+                "company_id": self.main_company.id,
             }
         )
         self._update_stock_quantity(self.prd_cable, other_lot, 1)
@@ -112,6 +116,29 @@ class TestSaleOrderLotSelection(TransactionCase):
             product, self.stock_location, lot_id=lot, quantity=qty
         )
 
+    def _create_picking(self, picking_type, location, location_dest, product_qtys, partner=None):
+        """Create a picking and its moves in a single create() call"""
+        return self.env["stock.picking"].create(
+            {
+                "partner_id": partner.id if partner else False,
+                "picking_type_id": picking_type.id,
+                "location_id": location.id,
+                "location_dest_id": location_dest.id,
+                "move_ids": [
+                    Command.create(
+                        {
+                            "product_id": product.id,
+                            "product_uom_qty": qty,
+                            "product_uom": product.uom_id.id,
+                            "location_id": location.id,
+                            "location_dest_id": location_dest.id,
+                        }
+                    )
+                    for product, qty in product_qtys
+                ],
+            }
+        )
+
     def test_01_several_lines_with_same_lot(self):
         """You may want split your order in several lines
         even if lot/product are the same
@@ -119,35 +146,19 @@ class TestSaleOrderLotSelection(TransactionCase):
         """
         self._update_stock_quantity(self.prd_cable, self.lot_cable, 10)
         self.sale.action_confirm()
+        self.assertEqual(self.sale.state, "sale")
+        self.assertEqual(self.sale.picking_ids.move_ids.restrict_lot_id, self.lot_cable)
 
     def test_02_sale_order_lot_selection(self):
         # INIT stock of products to 0
-        picking_out = self.env["stock.picking"].create(
-            {
-                "picking_type_id": self.env.ref("stock.picking_type_out").id,
-                "location_id": self.stock_location.id,
-                "location_dest_id": self.customer_location.id,
-            }
-        )
-        self.env["stock.move"].create(
-            {
-                "product_id": self.product_12.id,
-                "product_uom_qty": self.product_12.qty_available,
-                "product_uom": self.product_12.uom_id.id,
-                "picking_id": picking_out.id,
-                "location_id": self.stock_location.id,
-                "location_dest_id": self.customer_location.id,
-            }
-        )
-        self.env["stock.move"].create(
-            {
-                "product_id": self.product_46.id,
-                "product_uom_qty": self.product_46.qty_available,
-                "product_uom": self.product_46.uom_id.id,
-                "picking_id": picking_out.id,
-                "location_id": self.stock_location.id,
-                "location_dest_id": self.customer_location.id,
-            }
+        picking_out = self._create_picking(
+            self.picking_type_out,
+            self.stock_location,
+            self.customer_location,
+            [
+                (self.product_12, self.product_12.qty_available),
+                (self.product_46, self.product_46.qty_available),
+            ],
         )
         picking_out.action_confirm()
         picking_out.action_assign()
@@ -157,43 +168,12 @@ class TestSaleOrderLotSelection(TransactionCase):
         self.product_12.write({"tracking": "lot", "is_storable": True})
 
         # make products enter
-        picking_in = self.env["stock.picking"].create(
-            {
-                "partner_id": self.partner.id,
-                "picking_type_id": self.env.ref("stock.picking_type_in").id,
-                "location_id": self.supplier_location.id,
-                "location_dest_id": self.stock_location.id,
-            }
-        )
-        self.env["stock.move"].create(
-            {
-                "product_id": self.prd_cable.id,
-                "product_uom_qty": 1,
-                "product_uom": self.prd_cable.uom_id.id,
-                "picking_id": picking_in.id,
-                "location_id": self.supplier_location.id,
-                "location_dest_id": self.stock_location.id,
-            }
-        )
-        self.env["stock.move"].create(
-            {
-                "product_id": self.product_12.id,
-                "product_uom_qty": 1,
-                "product_uom": self.product_12.uom_id.id,
-                "picking_id": picking_in.id,
-                "location_id": self.supplier_location.id,
-                "location_dest_id": self.stock_location.id,
-            }
-        )
-        self.env["stock.move"].create(
-            {
-                "product_id": self.product_46.id,
-                "product_uom_qty": 2,
-                "product_uom": self.product_46.uom_id.id,
-                "picking_id": picking_in.id,
-                "location_id": self.supplier_location.id,
-                "location_dest_id": self.stock_location.id,
-            }
+        picking_in = self._create_picking(
+            self.picking_type_in,
+            self.supplier_location,
+            self.stock_location,
+            [(self.prd_cable, 1), (self.product_12, 1), (self.product_46, 2)],
+            partner=self.partner,
         )
         for move in picking_in.move_ids:
             self.assertEqual(move.state, "draft", "Wrong state of move line.")
@@ -320,9 +300,6 @@ class TestSaleOrderLotSelection(TransactionCase):
         self.sol3.lot_id = lot10.id
         # I'll try to confirm it to check lot reservation:
         # lot10 was delivered by order1
-        lot10_qty_available = self._retrieve_stock_quantity(
-            self.prd_cable, lot10, self.stock_location
-        )
         self.order3.action_confirm()
         self.assertEqual(self.order3.state, "sale")
         # products are not available for reservation (lot unavailable)